@@ -1,16 +1,32 @@
-from ast import Sub
 import json
 import urllib.request
-from datetime import datetime
+from datetime import datetime, timezone
 import re
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+# Uses the C-accelerated _elementtree for speed; the pure-Python module also works
+from xml.etree.ElementTree import Element, ElementTree, SubElement, indent
+
+# Valid dividers: hyphen, en-dash, em-dash, colon
+# Using Unicode escape sequences to avoid encoding issues
+_DIVIDER_RE = re.compile(r'\s*[-\u2013\u2014:]\s*')
+
+# Ordinal number + st/nd/rd/th + whitespace + "Special Report" or "Report"
+_ORDINAL_RE = re.compile(r'^\d+(st|nd|rd|th)\s+(Special\s+)?Report$', re.IGNORECASE)
+
+# RFC 822 date format used for pubDate and lastBuildDate
+_RFC822 = '%a, %d %b %Y %H:%M:%S GMT'
+
+# Enclosure attributes are the same for every item
+_ENCLOSURE_ATTRS = {
+    'type': 'image/png',
+    'url': 'https://committees.parliament.uk/dist/opengraph-card.png',
+    'length': '123456'
+}
 
 
 def fetch_json_data(api_url):
     """Fetch JSON data from API endpoint"""
-    with urllib.request.urlopen(api_url) as response:
-        return json.loads(response.read().decode())
+    with urllib.request.urlopen(api_url, timeout=30) as response:
+        return json.loads(response.read())
 
 def split_report_title(input_string):
     """
@@ -22,12 +38,8 @@ def split_report_title(input_string):
     Returns:
         tuple: (report_prefix, title) or ("", original_string) if invalid
     """
-    # Define valid dividers: hyphen, en-dash, em-dash, colon
-    # Using Unicode escape sequences to avoid encoding issues
-    divider_pattern = r'\s*[-\u2013\u2014:]\s*'
-    
     # Split on any of the valid dividers
-    parts = re.split(divider_pattern, input_string, maxsplit=1)
+    parts = _DIVIDER_RE.split(input_string, maxsplit=1)
     
     # Check if we got exactly 2 parts
     if len(parts) != 2:
@@ -37,14 +49,17 @@ def split_report_title(input_string):
     right_part = parts[1].strip()
     
     # Check if left part matches: ordinal number + "Report" or "Special Report"
-    # Pattern: number + st/nd/rd/th + (optional whitespace) + "Special Report" or "Report"
-    ordinal_pattern = r'^\d+(st|nd|rd|th)\s+(Special\s+)?Report$'
-    
-    if re.match(ordinal_pattern, left_part, re.IGNORECASE):
+    if _ORDINAL_RE.match(left_part):
         return (left_part, right_part)
     else:
         return ("Some sort of description....", input_string)
 
+def _sub(parent, tag, text):
+    """Add a child element with the given text to parent"""
+    elem = SubElement(parent, tag)
+    elem.text = text
+    return elem
+
 def create_rss_feed(feed_info, items):
     """
     Create RSS 2.0 feed from feed info and items
@@ -60,42 +75,38 @@ def create_rss_feed(feed_info, items):
     channel = SubElement(rss, 'channel')
     
     # Add channel elements
-    SubElement(channel, 'title').text = feed_info.get('title', 'RSS Feed')
-    SubElement(channel, 'link').text = feed_info.get('link', '')
-    SubElement(channel, 'description').text = feed_info.get('description', '')
+    _sub(channel, 'title', feed_info.get('title', 'RSS Feed'))
+    _sub(channel, 'link', feed_info.get('link', ''))
+    _sub(channel, 'description', feed_info.get('description', ''))
     
     if 'language' in feed_info:
-        SubElement(channel, 'language').text = feed_info['language']
+        _sub(channel, 'language', feed_info['language'])
     
     # Add last build date
-    SubElement(channel, 'lastBuildDate').text = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
+    _sub(channel, 'lastBuildDate', datetime.now(timezone.utc).strftime(_RFC822))
     
     # Add items
     for item_data in items:
-        if item_data.get('committee'):
-            if item_data.get('committee').get('house') == 'Lords':
-                continue  # Skip items from House of Lords
-            if item_data.get('committee').get('category'):
-               if item_data.get('committee').get('category').get('name') != 'Select':
-                   continue # Skip non-Select Committee items
+        committee = item_data.get('committee') or {}
+        category = committee.get('category') or {}
+        if committee.get('house') == 'Lords':
+            continue  # Skip items from House of Lords
+        if category and category.get('name') != 'Select':
+            continue # Skip non-Select Committee items
         item = SubElement(channel, 'item')
 
         api_description = item_data.get('description', '')
         ordinal, title = split_report_title(api_description)
-        committee = item_data.get('committee', dict())
         committee_name = committee.get('name','')
 
         rss_description = ordinal
         rss_description = rss_description.strip()
         
-        SubElement(item, 'title').text = title
-        SubElement(item, 'description').text = rss_description
-        SubElement(item, 'author').text = committee_name
+        _sub(item, 'title', title)
+        _sub(item, 'description', rss_description)
+        _sub(item, 'author', committee_name)
         
-        image = SubElement(item, 'enclosure ')
-        image.set('type', 'image/png')
-        image.set('url', 'https://committees.parliament.uk/dist/opengraph-card.png')
-        image.set('length', '123456')
+        SubElement(item, 'enclosure', _ENCLOSURE_ATTRS)
 
 
         link_text = ''
@@ -109,29 +120,34 @@ def create_rss_feed(feed_info, items):
             if publication_id != None and document_id != None:
                 link_text = f"https://committees.parliament.uk/publications/{publication_id}/documents/{document_id}/default/"
                                                 
-        SubElement(item, 'link').text = link_text
+        _sub(item, 'link', link_text)
         
         # Parse and format pubDate
-        if 'publicationStartDate' in item_data:
+        raw_date = item_data.get('publicationStartDate')
+        if raw_date:
+            # If pubDate is ISO format, convert to RFC 822
             try:
-                # If pubDate is ISO format, convert to RFC 822
-                pre_date_obj = item_data['publicationStartDate']+'Z'
-                date_obj = datetime.fromisoformat(pre_date_obj)
-                SubElement(item, 'pubDate').text = date_obj.strftime('%a, %d %b %Y %H:%M:%S GMT')
-            except:
-                SubElement(item, 'pubDate').text = item_data['publicationStartDate']
+                iso_date = raw_date[:-1] if raw_date.endswith('Z') else raw_date
+                date_obj = datetime.fromisoformat(iso_date)
+                if date_obj.tzinfo:
+                    date_obj = date_obj.astimezone(timezone.utc)
+                pub_date = date_obj.strftime(_RFC822)
+            except ValueError:
+                pub_date = raw_date
+            _sub(item, 'pubDate', pub_date)
         
         # Add GUID (use link if not provided)
         guid_text = str(item_data.get('id'))
-        SubElement(item, 'guid').text = guid_text
+        _sub(item, 'guid', guid_text)
     
     return rss
 
-def prettify_xml(elem):
-    """Return a pretty-printed XML string"""
-    rough_string = tostring(elem, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent='  ')
+def write_xml(elem, output_file):
+    """Write pretty-printed XML to a file as UTF-8"""
+    indent(elem, space='  ')
+    with open(output_file, 'wb') as f:
+        ElementTree(elem).write(f, encoding='utf-8', xml_declaration=True)
+        f.write(b'\n')
 
 def generate_rss(api_url, output_file):
     """
@@ -165,8 +181,7 @@ def generate_rss(api_url, output_file):
     rss = create_rss_feed(feed_info, items)
     
     # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(prettify_xml(rss))
+    write_xml(rss, output_file)
     
     print(f"RSS feed generated: {output_file}")
 